@@ -1,2 +1,20 @@
-from .interface_rslinx import InterfaceRsLinx
-from.data_processors import DataProcessors
\ No newline at end of file
+import importlib
+
+# Map each public name to the module defining it. The modules are imported on first access,
+# so that importing the package (e.g. for the command-line entry point) does not pull in pylogix.
+_LAZY_IMPORTS = {
+    "InterfaceRsLinx": ".interface_rslinx",
+    "DataProcessors": ".data_processors",
+    "HarvestJournal": ".harvest_journal",
+    "TagIndex": ".tag_index",
+    "RequestScheduler": ".request_scheduler",
+    "RequestPriority": ".request_scheduler",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+def __getattr__(name: str):
+    if name not in _LAZY_IMPORTS: raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,224 @@
+import argparse
+import csv
+import json
+import sys
+
+# Heavy imports (pylogix, ping3) happen inside the command handlers, so that short invocations
+# such as --help or argument errors return without loading them.
+
+def _status_callback(message: str, good: bool = True):
+    """
+    #### Description:
+    Callback handler printing status messages from InterfaceRsLinx methods to stderr.
+
+    #### Args:
+        message (str): The status message to display.
+        good (bool): Whether the message reports a success (unused, accepted for write callbacks).
+    """
+    print(message, file=sys.stderr)
+
+def _emit(data) -> None:
+    """
+    #### Description:
+    Print data to stdout as json.
+
+    #### Args:
+        data: JSON serializable data. Values that are not (e.g. datetimes) are printed as strings.
+    """
+    json.dump(data, sys.stdout, default=str)
+    sys.stdout.write('\n')
+
+def _read_text(file_path: str) -> str:
+    """
+    #### Description:
+    Read a text file, or stdin if the path is '-'.
+
+    #### Args:
+        file_path (str): Path to the file, or '-'.
+
+    #### Returns:
+        str: Content of the file.
+    """
+    if file_path == '-': return sys.stdin.read()
+    with open(file_path, 'r') as text_file:
+        return text_file.read()
+
+def _discover(args) -> int:
+    from .interface_rslinx import InterfaceRsLinx
+    devices = InterfaceRsLinx.discover_devices(args.subnet, callback=args.callback, timeout=args.timeout, plc_only=not args.all)
+    _emit(devices)
+    return 0
+
+def _browse(args) -> int:
+    from .interface_rslinx import InterfaceRsLinx
+    tag_info = InterfaceRsLinx._get_all_available_tags(args.ip, callback=args.callback)
+    if args.index:
+        from .tag_index import TagIndex
+        with TagIndex(args.index) as index:
+            index.add_tags(tag_info)
+    _emit(tag_info)
+    return 0
+
+def _search(args) -> int:
+    from .tag_index import TagIndex
+    with TagIndex(args.index, read_only=True) as index:
+        _emit(index.search(pattern=args.pattern, prefix=args.prefix, data_type=args.data_type, plc_ip=args.ip, limit=args.limit))
+    return 0
+
+def _read(args) -> int:
+    from .interface_rslinx import InterfaceRsLinx
+    tag_list = list(args.tags)
+    if args.file: tag_list += [line.strip() for line in _read_text(args.file).splitlines() if line.strip()]
+    if not tag_list: raise ValueError("no tags given to read.")
+    _emit(InterfaceRsLinx.read_tags(args.ip, tag_list, callback=args.callback))
+    return 0
+
+def _write(args) -> int:
+    from .data_processors import DataProcessors
+
+    # Collect the tags to write from the file and the command line (TAG=VALUE:TYPE).
+    tag_dict = {}
+    if args.file: tag_dict.update(DataProcessors.tab_delimited_string_to_tag_dict(_read_text(args.file)))
+    for assignment in args.tags:
+        if '=' not in assignment or ':' not in assignment.split('=', 1)[1]: raise ValueError(f"tag '{assignment}' is not in the form TAG=VALUE:TYPE.")
+        tag_name, value = assignment.split('=', 1)
+        value, data_type = value.rsplit(':', 1)
+        tag_dict[tag_name] = DataProcessors.convert_tag_value(value, data_type)
+    if not tag_dict: raise ValueError("no tags given to write.")
+
+    from .interface_rslinx import InterfaceRsLinx
+    successful, failed = InterfaceRsLinx.write_tags(args.ip, tag_dict, callback=args.callback)
+    _emit({"successful": successful, "failed": failed})
+    return 0 if failed == 0 else 1
+
+def _time(args) -> int:
+    from .interface_rslinx import InterfaceRsLinx
+    if args.action == 'get':
+        result = InterfaceRsLinx.get_plc_time(args.ip)
+        if result.Status != 'Success': raise Exception(result.Status)
+        _emit({"ip_address": args.ip, "time": result.Value.isoformat()})
+    else:
+        result = InterfaceRsLinx.set_plc_time(args.ip)
+        if result.Status != 'Success': raise Exception(result.Status)
+        _emit({"ip_address": args.ip, "status": result.Status})
+    return 0
+
+def _write_csv(data: dict, output_file) -> None:
+    """
+    #### Description:
+    Write tags as csv, in the columns of the tab-delimited export, quoting values that contain commas or quotes.
+
+    #### Args:
+        data (dict): Dictionary of tags, as returned by InterfaceRsLinx.get_all_available_tags.
+        output_file: Text file to write to, opened with newline=''.
+    """
+    writer = csv.writer(output_file)
+    for tag, tag_value in data.items():
+        writer.writerow([tag_value["ip_address"], tag, tag_value["value"], tag_value["data_type"]])
+
+def _export(args) -> int:
+    from .interface_rslinx import InterfaceRsLinx
+    from .data_processors import DataProcessors
+    data = InterfaceRsLinx.get_all_available_tags(args.ip, callback=args.callback, checkpoint_path=args.checkpoint)
+
+    # Write the tags to stdout, or to the output file and report a summary.
+    def write(output_file):
+        if args.format == 'json': output_file.write(json.dumps(data, default=str) + '\n')
+        elif args.format == 'csv': _write_csv(data, output_file)
+        else: output_file.write(DataProcessors.tag_dict_to_tab_delimited_string(data))
+    if args.output is None:
+        write(sys.stdout)
+    else:
+        with open(args.output, 'w', newline='') as output_file:
+            write(output_file)
+        _emit({"ip_address": args.ip, "tags": len(data), "output": args.output})
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    #### Description:
+    Build the argument parser of the command-line interface.
+
+    #### Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(prog="cga-lib", description="Non-interactive access to PLCs over EtherNet/IP. Results are printed to stdout as json.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print status messages to stderr.")
+    parser.add_argument("--rate", type=float, help="maximum requests per second sent to a plc.")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    commands.required = True
+
+    command = commands.add_parser("discover", help="discover plcs by broadcast or by scanning a subnet.")
+    command.add_argument("subnet", nargs="?", help="subnet to scan in cidr notation. broadcasts if omitted.")
+    command.add_argument("--timeout", type=float, default=0.5, help="per-host timeout in seconds. (default: 0.5)")
+    command.add_argument("--all", action="store_true", help="include devices that are not plcs.")
+    command.set_defaults(handler=_discover)
+
+    command = commands.add_parser("browse", help="list all tags of a plc, with udts flattened.")
+    command.add_argument("ip", help="ip address of the plc.")
+    command.add_argument("--index", help="tag index file to add the browse results to.")
+    command.set_defaults(handler=_browse)
+
+    command = commands.add_parser("search", help="search a tag index built with 'browse --index', without touching the network.")
+    command.add_argument("index", help="tag index file.")
+    command.add_argument("pattern", nargs="?", help="glob pattern the tag name must match, case-insensitive (e.g. '*Motor*.FaultCode').")
+    command.add_argument("--prefix", help="prefix the tag name must start with.")
+    command.add_argument("--data-type", help="data type the tag must have.")
+    command.add_argument("--ip", help="ip address of the plc the tag must belong to.")
+    command.add_argument("--limit", type=int, help="maximum number of matches.")
+    command.set_defaults(handler=_search)
+
+    command = commands.add_parser("read", help="read tag values.")
+    command.add_argument("ip", help="ip address of the plc.")
+    command.add_argument("tags", nargs="*", help="tag names to read.")
+    command.add_argument("-f", "--file", help="file with one tag name per line, '-' for stdin.")
+    command.set_defaults(handler=_read)
+
+    command = commands.add_parser("write", help="write tag values.")
+    command.add_argument("ip", help="ip address of the plc.")
+    command.add_argument("tags", nargs="*", help="tags to write, in the form TAG=VALUE:TYPE.")
+    command.add_argument("-f", "--file", help="tab-delimited file of tag_address, value and data_type, '-' for stdin.")
+    command.set_defaults(handler=_write)
+
+    command = commands.add_parser("time", help="get the plc time, or set it to the computer time.")
+    command.add_argument("action", choices=["get", "set"])
+    command.add_argument("ip", help="ip address of the plc.")
+    command.set_defaults(handler=_time)
+
+    command = commands.add_parser("export", help="read all tags and their values.")
+    command.add_argument("ip", help="ip address of the plc.")
+    command.add_argument("-o", "--output", help="file to write, stdout if omitted.")
+    command.add_argument("--format", choices=["json", "csv", "tab"], default="json", help="output format. (default: json)")
+    command.add_argument("--checkpoint", help="harvest journal path, to resume an interrupted export.")
+    command.set_defaults(handler=_export)
+
+    return parser
+
+def main(argv: list[str] = None) -> int:
+    """
+    #### Description:
+    Entry point of the command-line interface.
+
+    #### Args:
+        argv (list): Optional arguments, sys.argv is used if omitted.
+
+    #### Returns:
+        int: Exit code. 0 on success, 1 on failure, 130 if cancelled.
+    """
+    args = build_parser().parse_args(argv)
+    args.callback = _status_callback if args.verbose else None
+    try:
+        if args.rate is not None:
+            if args.rate <= 0: raise ValueError("rate must be positive.")
+            from .interface_rslinx import InterfaceRsLinx
+            InterfaceRsLinx.scheduler.max_requests_per_second = args.rate
+        return args.handler(args)
+    except KeyboardInterrupt:
+        print(json.dumps({"error": "operation cancelled by user."}), file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(json.dumps({"error": str(e)}), file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
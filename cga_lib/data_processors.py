@@ -45,6 +45,77 @@ class DataProcessors:
         except Exception as e:
             raise Exception(f"error converting tag dictionary to string: {e}")
         
+    @staticmethod
+    def device_list_to_tab_delimited_string(device_list: list) -> str:
+        """
+        #### Description:
+        Convert a list of device identity records to a tab-delimited string with Excel-compatible newlines.
+        
+        #### Args:
+            device_list (list): List of identity records, as returned by InterfaceRsLinx.discover_devices.
+        
+        #### Returns:
+            str: Tab-delimited string of devices with newlines.
+        """
+        try:
+            device_string = ''
+            for device in device_list:
+                device_string += device["ip_address"] + '\t'
+                device_string += str(device["product_name"]) + '\t'
+                device_string += str(device["device_type"]) + '\t'
+                device_string += str(device["serial_number"]) + '\t'
+                device_string += str(device["revision"]) + '\n'
+
+            return device_string
+        except Exception as e:
+            raise Exception(f"error converting device list to string: {e}")
+
+    @staticmethod
+    def convert_tag_value(value: str, data_type: str):
+        """
+        #### Description:
+        Convert a value given as text to the python type matching a PLC data type.
+        
+        #### Args:
+            value (str): Value as text.
+            data_type (str): PLC data type (e.g. "DINT", "REAL").
+        
+        #### Returns:
+            The converted value, else raises ValueError if the data type is not supported or the value does not parse.
+        """
+        data_type = data_type.upper()
+        if data_type == "BOOL":
+            if value.strip().lower() in ['1', 'true', 'yes']: return True
+            if value.strip().lower() in ['0', 'false', 'no']: return False
+            raise ValueError(f"value '{value}' is not a valid BOOL. expected 1/0, true/false or yes/no.")
+        if data_type in ["SINT", "INT", "DINT", "LINT", "USINT", "UINT", "UDINT"]: return int(value)
+        if data_type in ["REAL", "LREAL"]: return float(value)
+        if data_type == "STRING": return str(value)
+        raise ValueError(f"unsupported data type '{data_type}'.")
+
+    @staticmethod
+    def tab_delimited_string_to_tag_dict(content: str) -> dict:
+        """
+        #### Description:
+        Convert a tab-delimited string of tag_address, value and data_type columns to a dictionary of tags to write.
+        
+        #### Args:
+            content (str): Tab-delimited string with \\n line endings.
+        
+        #### Returns:
+            dict: Dictionary where keys are tag names and values are the converted values to write.
+        """
+        try:
+            tag_dict = {}
+            for line in content.strip().split('\n'):
+                parts = line.strip('\r').split('\t')
+                if len(parts) != 3: raise ValueError(f"expected 3 columns, got {len(parts)} in line '{line}'.")
+                tag_dict[parts[0]] = DataProcessors.convert_tag_value(parts[1], parts[2])
+
+            return tag_dict
+        except Exception as e:
+            raise Exception(f"error converting string to tag dictionary: {e}")
+
     @staticmethod
     def save_tags_to_csv(content: str, file_path: str) -> None:
         """
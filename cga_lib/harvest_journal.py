@@ -0,0 +1,133 @@
+import json
+import os
+from datetime import datetime, timezone
+
+class HarvestJournal:
+
+    @staticmethod
+    def load(file_path: str, plc_ip: str, max_age_seconds: float = 3600) -> tuple[str, dict, set]:
+        """
+        #### Description:
+        Load the checkpoints of the latest harvest run of a PLC from an append-only harvest journal.
+        Checkpoints of older runs, and runs last checkpointed longer ago than the maximum age, are ignored,
+        so values from a finished or abandoned harvest are never returned as fresh.
+
+        #### Args:
+            file_path (str): Path to the journal file.
+            plc_ip (str): IP address of the PLC.
+            max_age_seconds (float): Maximum time since the last checkpoint of the run to resume, in seconds.
+
+        #### Returns:
+            tuple: Run id to resume (None if there is none), dictionary of tag names to values already read,
+                   and set of tag names already tried that failed to read.
+        """
+
+        # Create containers to hold the checkpointed progress of each run, and the run checkpointed last.
+        runs = {}
+        latest_run_id = None
+
+        # If there is no journal yet, there is no progress.
+        if not os.path.exists(file_path): return None, {}, set()
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as journal_file:
+                for line in journal_file:
+
+                    # Skip a line torn by an interruption mid-write, it is simply read again.
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+                    # Only keep checkpoints for the requested PLC.
+                    if entry.get("ip_address") != plc_ip or "run_id" not in entry: continue
+                    run = runs.setdefault(entry["run_id"], {"last_utc": entry["timestamp_utc"], "values": {}, "failed": set()})
+                    run["last_utc"] = max(run["last_utc"], entry["timestamp_utc"])
+                    latest_run_id = entry["run_id"]
+                    run["values"].update(entry["values"])
+                    run["failed"].update(entry["failed"])
+        except Exception as e:
+            raise Exception(f"error reading harvest journal at '{file_path}': {e}")
+
+        # Resume the run checkpointed last, unless it was interrupted too long ago. A long harvest stays resumable.
+        if latest_run_id is None: return None, {}, set()
+        run = runs[latest_run_id]
+        age = datetime.now(timezone.utc) - datetime.fromisoformat(run["last_utc"])
+        if age.total_seconds() > max_age_seconds: return None, {}, set()
+        return latest_run_id, run["values"], run["failed"] - set(run["values"])
+
+    @staticmethod
+    def append(file_path: str, plc_ip: str, run_id: str, values: dict, failed: list[str] = ()) -> None:
+        """
+        #### Description:
+        Append a completed batch of tag reads to the harvest journal and flush it to disk.
+
+        #### Args:
+            file_path (str): Path to the journal file.
+            plc_ip (str): IP address of the PLC.
+            run_id (str): Id of the harvest run the batch belongs to.
+            values (dict): Dictionary of tag names to values read in the batch.
+            failed (list): Tag names tried in the batch that failed to read.
+
+        #### Returns:
+            None
+        """
+        try:
+            entry = json.dumps({"ip_address": plc_ip,
+                                "run_id": run_id,
+                                "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                                "values": values,
+                                "failed": list(failed)}, default=str)
+            with open(file_path, 'a+b') as journal_file:
+
+                # Terminate a line torn by an earlier interruption, so this entry starts on its own line.
+                if journal_file.tell() > 0:
+                    journal_file.seek(-1, os.SEEK_END)
+                    if journal_file.read(1) != b'\n': entry = '\n' + entry
+
+                journal_file.write((entry + '\n').encode('utf-8'))
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+        except Exception as e:
+            raise Exception(f"error writing harvest journal at '{file_path}': {e}")
+
+    @staticmethod
+    def clear(file_path: str, plc_ip: str) -> None:
+        """
+        #### Description:
+        Remove the checkpoints of a PLC from the harvest journal once a harvest pass has finished.
+        The journal file is deleted when no other PLC has checkpoints left in it.
+
+        #### Args:
+            file_path (str): Path to the journal file.
+            plc_ip (str): IP address of the PLC.
+
+        #### Returns:
+            None
+        """
+
+        # If there is no journal, there is nothing to clear.
+        if not os.path.exists(file_path): return
+
+        try:
+
+            # Keep the lines belonging to other PLCs.
+            remaining = []
+            with open(file_path, 'r', encoding='utf-8') as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if entry.get("ip_address") != plc_ip: remaining.append(line)
+
+            # Delete the journal if it is now empty, otherwise swap in the trimmed copy.
+            if not remaining:
+                os.remove(file_path)
+            else:
+                temp_path = file_path + '.tmp'
+                with open(temp_path, 'w', encoding='utf-8') as journal_file:
+                    journal_file.writelines(remaining)
+                os.replace(temp_path, file_path)
+        except Exception as e:
+            raise Exception(f"error clearing harvest journal at '{file_path}': {e}")
@@ -2,10 +2,74 @@ import re
 from pylogix import PLC
 from datetime import datetime, timezone
 import concurrent.futures
+import threading
+from contextlib import contextmanager
+import ipaddress
+import uuid
 from ping3 import ping
+from .harvest_journal import HarvestJournal
+from .request_scheduler import RequestScheduler, RequestPriority
 
 class InterfaceRsLinx:
 
+    # Scheduler queueing every request sent to a PLC by priority. Configure its limits to protect production traffic,
+    # e.g. InterfaceRsLinx.scheduler.configure("192.168.1.10", max_requests_per_second=50).
+    # Each request pylogix sends counts, including the pages and UDT templates of a browse and the type lookups of a read.
+    # Connection setup (forward open), the precheck ping and discovery probes are not scheduled.
+    scheduler = RequestScheduler()
+
+    # Largest number of addresses a subnet scan may probe (a /20), so a mistyped prefix cannot queue millions of probes.
+    MAX_SCAN_ADDRESSES = 4096
+
+    # Statuses pylogix reports when the connection itself failed, rather than the tag. Socket exceptions are
+    # reported as 'Unknown error <exception>'.
+    CONNECTION_FAILURE_STATUSES = ('Connection failure', 'Connection lost')
+    CONNECTION_FAILURE_STATUS_PREFIX = 'Unknown error'
+
+    # Bytes of each packet taken by the multiple service headers and the sequence count.
+    PACKET_OVERHEAD = 12
+
+    # Value sizes of string types, in bytes (length DINT and 82 characters, padded), and of anything unknown.
+    STRING_TYPE_SIZES = {"STRING": 88}
+    UNKNOWN_TYPE_SIZE = 88
+
+    # Atomic data types whose CIP type code is passed to pylogix with each read, so it skips its per-tag type lookup.
+    ATOMIC_DATA_TYPES = ("BOOL", "SINT", "INT", "DINT", "LINT", "USINT", "UINT", "UDINT", "ULINT", "REAL", "LREAL", "BYTE", "WORD", "DWORD", "LWORD")
+
+    @staticmethod
+    @contextmanager
+    def _scheduled(plc, priority: int):
+        """
+        #### Description:
+        Context manager routing every request the connection sends through the scheduler, one slot per request,
+        so calls that make many round trips inside pylogix (e.g. GetTagList) respect the limits.
+        
+        #### Args:
+            plc: The PLC connection object.
+            priority (int): Scheduling priority of the requests, one of RequestPriority.
+        """
+
+        # Without the pylogix send hook, hold a single slot for the whole call instead.
+        send = getattr(getattr(plc, "conn", None), "send", None)
+        if send is None:
+            with InterfaceRsLinx.scheduler.request(plc.IPAddress, priority):
+                yield
+            return
+
+        # The calling thread is the caller, even when pylogix is driven from a worker thread.
+        caller = threading.get_ident()
+        def scheduled_send(*args, **kwargs):
+            with InterfaceRsLinx.scheduler.request(plc.IPAddress, priority, caller):
+                return send(*args, **kwargs)
+
+        overridden = "send" in vars(plc.conn)
+        plc.conn.send = scheduled_send
+        try:
+            yield
+        finally:
+            if overridden: plc.conn.send = send
+            else: del plc.conn.send
+
     @staticmethod
     def _precheck_device(ip: str) -> bool:
         """
@@ -81,7 +145,8 @@ class InterfaceRsLinx:
             device.IPAddress = ip
 
             # Get device properties.
-            properties = device.GetDeviceProperties()
+            with InterfaceRsLinx._scheduled(device, RequestPriority.POLL):
+                properties = device.GetDeviceProperties()
 
             # If the device type is PLC, return True.
             if properties.Value.DeviceType == 'Programmable Logic Controller': return True
@@ -90,7 +155,271 @@ class InterfaceRsLinx:
             else: raise Exception(f"device at ip '{ip}' is not a plc.")
 
     @staticmethod
-    def read_tags(plc_ip: str, tag_list: list[str], callback=None) -> dict:
+    def _device_to_identity(device) -> dict:
+        """
+        #### Description:
+        Convert a pylogix device object into an identity record.
+        
+        #### Args:
+            device: The Device object returned by pylogix (Discover or GetDeviceProperties).
+        
+        #### Returns:
+            dict: Identity record of the device.
+        """
+        return {
+            "ip_address": device.IPAddress,
+            "device_type": device.DeviceType,
+            "product_name": device.ProductName,
+            "product_code": device.ProductCode,
+            "vendor": device.Vendor,
+            "serial_number": device.SerialNumber,
+            "revision": device.Revision
+        }
+
+    @staticmethod
+    def _probe_device(ip: str, timeout: float) -> dict:
+        """
+        #### Description:
+        Request the identity of the device at the given IP address.
+        
+        #### Args:
+            ip (str): IP address.
+            timeout (float): Socket timeout in seconds.
+        
+        #### Returns:
+            dict: Identity record of the device, or None if nothing answered.
+        """
+        try:
+
+            # Create a plc connection object with the context manager.
+            with PLC() as device:
+
+                # Set the ip address and a short timeout so silent hosts fail fast.
+                device.IPAddress = ip
+                device.SocketTimeout = timeout
+
+                # Get device properties.
+                properties = device.GetDeviceProperties()
+
+            # If nothing answered, there is no device to report.
+            if properties.Status != 'Success' or not properties.Value.DeviceType: return None
+
+            # Build the identity record. The device reports its own ip as 0.0.0.0 on some firmware.
+            identity = InterfaceRsLinx._device_to_identity(properties.Value)
+            identity["ip_address"] = ip
+            return identity
+
+        except Exception:
+            return None
+
+    @staticmethod
+    def discover_devices(subnet: str = None, callback=None, timeout: float = 0.5, max_workers: int = 64, plc_only: bool = True) -> list[dict]:
+        """
+        #### Description:
+        Discover devices on the network. With no subnet, an EtherNet/IP ListIdentity broadcast is sent.
+        With a subnet in CIDR notation (e.g. "192.168.1.0/24"), every host address is probed concurrently.
+        
+        #### Args:
+            subnet (str): Optional subnet to scan in CIDR notation, of at most MAX_SCAN_ADDRESSES addresses.
+            callback: Optional callback function to receive status messages.
+            timeout (float): Per-host timeout in seconds when scanning a subnet.
+            max_workers (int): Maximum number of hosts probed at the same time.
+            plc_only (bool): If True, only programmable logic controllers are returned.
+        
+        #### Returns:
+            list: Identity records (ip_address, device_type, product_name, product_code, vendor, serial_number, revision), sorted by ip address.
+        """
+
+        # Create a list to hold the identity records.
+        devices = []
+
+        # If no subnet was given, broadcast a ListIdentity request.
+        if subnet is None:
+            if callback: callback("broadcasting list identity request...")
+            with PLC() as plc:
+                result = plc.Discover()
+            if result.Status != 'Success': raise Exception(result.Status)
+            devices = [InterfaceRsLinx._device_to_identity(device) for device in result.Value]
+
+        # Otherwise, probe each host in the subnet.
+        else:
+
+            # Validate the subnet format.
+            if not isinstance(subnet, str): raise TypeError("subnet failed type check. expected str.")
+            try:
+                network = ipaddress.ip_network(subnet, strict=False)
+            except ValueError:
+                raise ValueError(f"subnet '{subnet}' failed cidr check.")
+            if network.num_addresses > InterfaceRsLinx.MAX_SCAN_ADDRESSES:
+                raise ValueError(f"subnet '{network}' has {network.num_addresses} addresses, more than the {InterfaceRsLinx.MAX_SCAN_ADDRESSES} a scan may probe.")
+            hosts = [str(host) for host in network.hosts()]
+
+            # Probe the hosts concurrently, each bounded by the timeout.
+            if callback: callback(f"scanning {len(hosts)} addresses in subnet '{network}'...")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(InterfaceRsLinx._probe_device, host, timeout): host for host in hosts}
+                for future in concurrent.futures.as_completed(futures):
+                    identity = future.result()
+                    if identity is None: continue
+                    if callback: callback(f"found '{identity['product_name']}' at ip '{identity['ip_address']}'")
+                    devices.append(identity)
+
+        # Filter out anything that is not a PLC, if requested.
+        if plc_only: devices = [device for device in devices if device["device_type"] == 'Programmable Logic Controller']
+
+        # Return the devices sorted by ip address.
+        return sorted(devices, key=lambda device: ipaddress.ip_address(device["ip_address"]))
+
+    @staticmethod
+    def _tag_sort_key(tag_name: str) -> tuple:
+        """
+        #### Description:
+        Sort key placing members of the same UDT next to each other, and array elements in index order.
+        
+        #### Args:
+            tag_name (str): Tag name (e.g. "Motors[10].Status.Fault").
+        
+        #### Returns:
+            tuple: The key.
+        """
+        return tuple((0, int(part), '') if part.isdigit() else (1, 0, part.lower()) for part in re.split(r'[.\[\],]', tag_name) if part != '')
+
+    @staticmethod
+    def _encoded_request_size(tag_name: str) -> int:
+        """
+        #### Description:
+        Size in bytes of the read service for a tag within a multiple service packet.
+        
+        #### Args:
+            tag_name (str): Tag name.
+        
+        #### Returns:
+            int: Size in bytes: offset, service code, path size, path and element count.
+        """
+        path_size = 0
+        for segment in re.split(r'\.', tag_name):
+            name, _, indexes = segment.partition('[')
+
+            # Symbolic segment: type, length and name, padded to an even length. Bit members are a one word segment.
+            path_size += 2 if name.isdigit() else 2 + len(name) + len(name) % 2
+
+            # Element segments, sized by the index value.
+            for index in re.findall(r'\d+', indexes):
+                index = int(index)
+                path_size += 2 if index <= 0xFF else 4 if index <= 0xFFFF else 6
+        return 2 + 2 + path_size + 2
+
+    @staticmethod
+    def _encoded_response_size(type_sizes: dict, data_type: str) -> int:
+        """
+        #### Description:
+        Size in bytes of the read reply for a tag within a multiple service packet.
+        
+        #### Args:
+            type_sizes (dict): Dictionary of data types to value sizes in bytes.
+            data_type (str): Data type of the tag, None if unknown.
+        
+        #### Returns:
+            int: Size in bytes: offset, reply header, type code and value. Unknown types are assumed to be large.
+        """
+        return 2 + 4 + 2 + type_sizes.get(data_type, InterfaceRsLinx.UNKNOWN_TYPE_SIZE)
+
+    @staticmethod
+    def _count_tags_filling_packets(plc, tag_list: list[str], data_types: dict, packet_count: int, start: int = 0) -> int:
+        """
+        #### Description:
+        Count how many tags, from the start index, fill the given number of packets at the connection size
+        pylogix negotiated, for both the request and the reply. Used to size the batches between checkpoints.
+        
+        #### Args:
+            plc: The PLC connection object.
+            tag_list (list): List of tag names to read, in read order.
+            data_types (dict): Dictionary of tag names to data types, for the reply sizes.
+            packet_count (int): Number of packets to fill.
+            start (int): Index of the first tag to count from.
+        
+        #### Returns:
+            int: Number of tags, at least one if any are left after the start index.
+        """
+
+        # Room left in a packet once the multiple service headers (and sequence count) are accounted for.
+        # pylogix reports 508 bytes until it has connected, then the size it negotiated (4002 with a Large Forward Open).
+        budget = plc.ConnectionSize - InterfaceRsLinx.PACKET_OVERHEAD
+
+        # Use the atomic type sizes known to pylogix, then the string sizes.
+        type_sizes = {value[1]: value[0] for value in plc.CIPTypes.values()}
+        type_sizes.update(InterfaceRsLinx.STRING_TYPE_SIZES)
+
+        # Fill the packets in list order.
+        packets = 1
+        request_size = 0
+        response_size = 0
+        for index in range(start, len(tag_list)):
+            tag_request_size = InterfaceRsLinx._encoded_request_size(tag_list[index])
+            tag_response_size = InterfaceRsLinx._encoded_response_size(type_sizes, data_types.get(tag_list[index]))
+            if index > start and (request_size + tag_request_size > budget or response_size + tag_response_size > budget):
+                if packets == packet_count: return index - start
+                packets += 1
+                request_size = 0
+                response_size = 0
+            request_size += tag_request_size
+            response_size += tag_response_size
+
+        return len(tag_list) - start
+
+    @staticmethod
+    def _read_tag_list(plc, tag_list: list[str], callback=None, priority: int = RequestPriority.POLL, data_types: dict = None) -> dict:
+        """
+        #### Description:
+        Read tags over an open PLC connection in a single multi-tag read, which pylogix splits into packets
+        filled up to the connection size. Tags are ordered so UDT members and array elements sit together,
+        and the type of atomic tags is passed along so pylogix does not look it up with an extra round trip per tag.
+        
+        #### Args:
+            plc: The PLC connection object.
+            tag_list (list): List of tag names to read.
+            callback: Optional callback function to receive status messages.
+            priority (int): Scheduling priority of the reads, one of RequestPriority.
+            data_types (dict): Optional dictionary of tag names to data types.
+        
+        #### Returns:
+            Dictionary with tag names as keys and values, for the tags read successfully.
+            Raises ConnectionError if the connection fails, as opposed to a tag failing to read.
+        """
+
+        # Create a dictionary to hold results info.
+        results = {}
+        if not tag_list: return results
+
+        # Order the tags, and give each atomic tag its type code.
+        data_types = data_types or {}
+        type_codes = {value[1]: code for code, value in plc.CIPTypes.items() if value[1] in InterfaceRsLinx.ATOMIC_DATA_TYPES}
+        tag_list = sorted(tag_list, key=InterfaceRsLinx._tag_sort_key)
+        requests = [(tag, 1, type_codes[data_types[tag]]) if data_types.get(tag) in type_codes else tag for tag in tag_list]
+
+        # Read the tags.
+        msg = f"reading value of {len(tag_list)} tag(s) from: '{tag_list[0]}'"
+        if callback: callback(msg)
+        with InterfaceRsLinx._scheduled(plc, priority):
+            responses = plc.Read(requests)
+
+        # If the connection failed, pylogix reports it as the status of the tags and stops reading the remaining
+        # packets. Raise rather than reporting those tags as unreadable.
+        for result in responses:
+            if result.Status in InterfaceRsLinx.CONNECTION_FAILURE_STATUSES or result.Status.startswith(InterfaceRsLinx.CONNECTION_FAILURE_STATUS_PREFIX):
+                raise ConnectionError(f"connection to plc at ip '{plc.IPAddress}' failed: {result.Status}")
+        if len(responses) < len(requests):
+            raise ConnectionError(f"connection to plc at ip '{plc.IPAddress}' failed: {len(responses)} of {len(requests)} tags answered.")
+
+        # If retrieval was successful, add to the dictionary.
+        for tag, result in zip(tag_list, responses):
+            if result.Status == 'Success': results[tag] = result.Value
+
+        # Return results.
+        return results
+
+    @staticmethod
+    def read_tags(plc_ip: str, tag_list: list[str], callback=None, priority: int = RequestPriority.POLL, data_types: dict = None) -> dict:
         """
         #### Description:
         Read tags from the PLC.
@@ -99,6 +428,8 @@ class InterfaceRsLinx:
             plc_ip (str): IP address of the PLC.
             tag_list (list): List of tag names to read.
             callback: Optional callback function to receive status messages.
+            priority (int): Scheduling priority of the reads, one of RequestPriority.
+            data_types (dict): Optional dictionary of tag names to data types, used to pack the reads.
         
         #### Returns:
             Dictionary with tag names as keys and values.
@@ -107,36 +438,14 @@ class InterfaceRsLinx:
         # Precheck the device.
         InterfaceRsLinx._precheck_device(plc_ip)
 
-        # Create a dictionary to hold results info.
-        results = {}
-        
         # Create a plc connection object with the context manager.
         with PLC() as plc:
             
             # Set the ip address of the PLC.
             plc.IPAddress = plc_ip
 
-            # For each tag in the passed list...
-            for tag in tag_list:
-
-                try:
-
-                    # Read the tag with timeout of 3 seconds.
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        msg = f"reading value of tag: '{tag}'"
-                        if callback: callback(msg)
-                        future = executor.submit(plc.Read, tag)
-                        try:
-                            result = future.result(timeout=2)
-                        except concurrent.futures.TimeoutError:
-                            raise TimeoutError(f"timeout reading tag '{tag}' after 2 seconds"); return
-
-                    # If retrieval was successful, add to the dictionary.
-                    if result.Status == 'Success': results[tag] = result.Value
-                    if result.Status == 'Unknown error [WinError 10061] No connection could be made because the target machine actively refused it':
-                        raise Exception("connection refused by target machine."); return
-                except Exception:
-                    pass
+            # Read the tags.
+            results = InterfaceRsLinx._read_tag_list(plc, tag_list, callback, priority, data_types)
 
         # Verify that some tags were read...
         if len(results) == 0: raise Exception("no tags were read from the plc.")
@@ -169,7 +478,8 @@ class InterfaceRsLinx:
             plc.IPAddress = plc_ip
 
             # Get the time.
-            result = plc.GetPLCTime()
+            with InterfaceRsLinx._scheduled(plc, RequestPriority.POLL):
+                result = plc.GetPLCTime()
 
         # Return results.
         return result
@@ -196,8 +506,9 @@ class InterfaceRsLinx:
             # Set the ip address of the PLC.
             plc.IPAddress = plc_ip
 
-            # Get the time.
-            result = plc.SetPLCTime()
+            # Set the time.
+            with InterfaceRsLinx._scheduled(plc, RequestPriority.WRITE):
+                result = plc.SetPLCTime()
 
         # Return results.
         return result
@@ -233,7 +544,8 @@ class InterfaceRsLinx:
             for tag_name, value in tag_dict.items():
 
                 # Write the tag.
-                result = plc.Write(tag_name, value)
+                with InterfaceRsLinx._scheduled(plc, RequestPriority.WRITE):
+                    result = plc.Write(tag_name, value)
                 
                 # If write was successful, add to the results dictionary.
                 if result.Status == 'Success':
@@ -325,7 +637,8 @@ class InterfaceRsLinx:
             # Get the tag list.
             msg = f"retrieving tag list from plc at ip '{plc_ip}'..."
             if callback: callback(msg)
-            tags = plc.GetTagList()
+            with InterfaceRsLinx._scheduled(plc, RequestPriority.BULK):
+                tags = plc.GetTagList()
 
             # Create a dictionary to hold tag info.
             tag_info = {}
@@ -371,22 +684,102 @@ class InterfaceRsLinx:
                 raise Exception(tags.Status)
 
     @staticmethod
-    def get_all_available_tags(plc_ip: str, callback=None) -> dict:
+    def get_all_available_tags(plc_ip: str, callback=None, checkpoint_path: str = None, packets_per_checkpoint: int = 4, max_age_seconds: float = 3600) -> dict:
         """
         #### Description:
         Public method to get all available tags (and their values) from the PLC.
+        If a checkpoint path is given, each completed batch of reads is appended to a journal at that path,
+        and a rerun after an interruption only reads the tags the interrupted run had not tried yet.
+        The journal is cleared once every tag has been tried, whether or not it could be read.
         
         #### Args:
             plc_ip (str): IP address of the PLC.
             callback: Optional callback function to receive status messages.
+            checkpoint_path (str): Optional path of the harvest journal.
+            packets_per_checkpoint (int): Number of packets, filled to the connection size, read between checkpoints.
+            max_age_seconds (float): Maximum time, in seconds, since the last checkpoint of an interrupted run to resume. Older runs are started over.
         
         #### Returns:
             dict: Dictionary with tag names as keys and data types as values, else raises Exception on failure.
+            Raises ConnectionError if the connection fails mid-harvest, keeping the journal for a rerun to resume.
         """
         data = InterfaceRsLinx._get_all_available_tags(plc_ip, callback=callback)
         list_of_tags = list(data.keys())
-        read_data = InterfaceRsLinx.read_tags(plc_ip, list_of_tags, callback=callback)
+        data_types = {tag: data[tag]["data_type"] for tag in list_of_tags}
+
+        # Without a checkpoint, read everything in one go.
+        if checkpoint_path is None:
+            read_data = InterfaceRsLinx.read_tags(plc_ip, list_of_tags, callback=callback, priority=RequestPriority.BULK, data_types=data_types)
+
+        # With a checkpoint, resume from the journal and checkpoint each batch.
+        else:
+            run_id, read_data, failed = HarvestJournal.load(checkpoint_path, plc_ip, max_age_seconds)
+            remaining = sorted((tag for tag in list_of_tags if tag not in read_data and tag not in failed), key=InterfaceRsLinx._tag_sort_key)
+            if run_id is None: run_id = uuid.uuid4().hex
+            elif callback: callback(f"resuming harvest, {len(read_data) + len(failed)} tags already tried, {len(remaining)} remaining...")
+
+            # Create a plc connection object with the context manager.
+            with PLC() as plc:
+
+                # Set the ip address of the PLC.
+                plc.IPAddress = plc_ip
+
+                # Read each batch and checkpoint the values read, and the tags that failed with a per-tag error.
+                # A connection failure raises before the batch is journaled, so a rerun resumes from the last checkpoint.
+                # The batches are sized after each read, as the connection size is known once pylogix has connected.
+                start = 0
+                while start < len(remaining):
+                    count = InterfaceRsLinx._count_tags_filling_packets(plc, remaining, data_types, packets_per_checkpoint, start)
+                    batch = remaining[start:start + count]
+                    start += count
+                    batch_data = InterfaceRsLinx._read_tag_list(plc, batch, callback, RequestPriority.BULK, data_types)
+                    batch_failed = [tag for tag in batch if tag not in batch_data]
+                    HarvestJournal.append(checkpoint_path, plc_ip, run_id, batch_data, batch_failed)
+                    read_data.update(batch_data)
+                    failed.update(batch_failed)
+
+            # The pass is finished, so the next harvest starts over.
+            HarvestJournal.clear(checkpoint_path, plc_ip)
+            if callback and failed: callback(f"{len(failed)} tags could not be read.")
+
         for tag in data.keys():
             if tag in read_data:
                 data[tag]["value"] = read_data[tag]
         return data
+
+    @staticmethod
+    def get_all_available_tags_from_devices(devices: list, callback=None, max_workers: int = 4) -> tuple[dict, dict]:
+        """
+        #### Description:
+        Get all available tags (and their values) from several PLCs at once.
+        
+        #### Args:
+            devices (list): IP addresses, or identity records as returned by discover_devices.
+            callback: Optional callback function to receive status messages.
+            max_workers (int): Maximum number of PLCs harvested at the same time.
+        
+        #### Returns:
+            tuple: Dictionary of ip address to tag dictionary for each PLC harvested,
+                   and dictionary of ip address to error message for each PLC that failed.
+        """
+
+        # Accept identity records as well as plain ip addresses.
+        plc_ips = [device["ip_address"] if isinstance(device, dict) else device for device in devices]
+
+        # Create dictionaries to hold the results and errors.
+        results = {}
+        errors = {}
+
+        # Harvest each PLC on its own thread.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(InterfaceRsLinx.get_all_available_tags, plc_ip, callback): plc_ip for plc_ip in plc_ips}
+            for future in concurrent.futures.as_completed(futures):
+                plc_ip = futures[future]
+                try:
+                    results[plc_ip] = future.result()
+                except Exception as e:
+                    if callback: callback(f"harvest of plc at ip '{plc_ip}' failed: {e}")
+                    errors[plc_ip] = str(e)
+
+        # Return results.
+        return results, errors
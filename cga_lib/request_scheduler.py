@@ -0,0 +1,169 @@
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+
+class RequestPriority:
+    """
+    #### Description:
+    Priority classes of PLC requests. Lower values are served first.
+    """
+    WRITE = 0
+    POLL = 1
+    BULK = 2
+
+class _ControllerQueue:
+    """
+    #### Description:
+    Scheduling state of a single PLC.
+    """
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.queue = []
+        self.in_flight = 0
+        self.next_start = 0.0
+        self.served_rounds = {}
+        self.caller_rounds = {}
+
+class RequestScheduler:
+
+    def __init__(self, max_requests_per_second: float = None, max_in_flight: int = 1):
+        """
+        #### Description:
+        Queue requests per PLC, serving them by priority class, under a request-rate and an in-flight limit.
+        Within a priority class, callers (threads, unless named otherwise) are served round-robin,
+        so one large sweep cannot starve other callers sharing the PLC.
+
+        #### Args:
+            max_requests_per_second (float): Default request-rate limit per PLC, None for no limit.
+            max_in_flight (int): Default number of requests a PLC may have in progress at once.
+        """
+        self.max_requests_per_second = max_requests_per_second
+        self.max_in_flight = max_in_flight
+        self._limits = {}
+        self._controllers = {}
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+
+    def configure(self, plc_ip: str, max_requests_per_second: float = None, max_in_flight: int = None) -> None:
+        """
+        #### Description:
+        Override the limits of a single PLC. Limits left as None fall back to the scheduler defaults.
+
+        #### Args:
+            plc_ip (str): IP address of the PLC.
+            max_requests_per_second (float): Request-rate limit of the PLC.
+            max_in_flight (int): Number of requests the PLC may have in progress at once.
+        """
+        if max_in_flight is not None and max_in_flight < 1: raise ValueError("max_in_flight must be at least 1.")
+        if max_requests_per_second is not None and max_requests_per_second <= 0: raise ValueError("max_requests_per_second must be positive.")
+        with self._lock:
+            self._limits[plc_ip] = (max_requests_per_second, max_in_flight)
+        self._notify(plc_ip)
+
+    def _get_limits(self, plc_ip: str) -> tuple:
+        """
+        #### Description:
+        Get the limits applying to a PLC.
+
+        #### Returns:
+            tuple: Request-rate limit (None for no limit) and in-flight limit.
+        """
+        rate, in_flight = self._limits.get(plc_ip, (None, None))
+        return (rate if rate is not None else self.max_requests_per_second,
+                in_flight if in_flight is not None else self.max_in_flight)
+
+    def _get_controller(self, plc_ip: str) -> _ControllerQueue:
+        """
+        #### Description:
+        Get the scheduling state of a PLC, creating it on first use.
+        """
+        with self._lock:
+            if plc_ip not in self._controllers: self._controllers[plc_ip] = _ControllerQueue()
+            return self._controllers[plc_ip]
+
+    def _notify(self, plc_ip: str) -> None:
+        """
+        #### Description:
+        Wake the requests waiting on a PLC, so they re-evaluate the limits.
+        """
+        controller = self._get_controller(plc_ip)
+        with controller.condition:
+            controller.condition.notify_all()
+
+    @contextmanager
+    def request(self, plc_ip: str, priority: int = RequestPriority.POLL, caller=None):
+        """
+        #### Description:
+        Context manager holding a request slot on a PLC. Blocks until the request is due.
+
+        #### Args:
+            plc_ip (str): IP address of the PLC.
+            priority (int): Priority class, one of RequestPriority.
+            caller: Optional identity of the caller for fair interleaving, the current thread if omitted.
+        """
+        self._acquire(plc_ip, priority, caller if caller is not None else threading.get_ident())
+        try:
+            yield
+        finally:
+            self._release(plc_ip)
+
+    def _acquire(self, plc_ip: str, priority: int, caller) -> None:
+        """
+        #### Description:
+        Queue a request and block until it is served.
+        """
+        controller = self._get_controller(plc_ip)
+        with controller.condition:
+
+            # Give the request the caller's next round within its priority class. Requests are served
+            # by priority, then round, so callers take turns instead of being served in arrival order.
+            served_round = controller.served_rounds.get(priority, 0)
+            request_round = max(controller.caller_rounds.get((priority, caller), 0), served_round)
+            controller.caller_rounds[(priority, caller)] = request_round + 1
+            ticket = (priority, request_round, next(self._sequence))
+            heapq.heappush(controller.queue, ticket)
+
+            # Wait until the request is at the head of the queue and the limits allow it to start.
+            try:
+                while True:
+                    max_requests_per_second, max_in_flight = self._get_limits(plc_ip)
+                    if controller.queue[0] == ticket and controller.in_flight < max_in_flight:
+                        delay = controller.next_start - time.monotonic()
+                        if delay <= 0: break
+                        controller.condition.wait(delay)
+                    else:
+                        controller.condition.wait()
+
+            # If the wait is interrupted (e.g. ctrl+c), withdraw the request so it does not block the queue.
+            except BaseException:
+                controller.caller_rounds[(priority, caller)] = request_round
+                controller.queue.remove(ticket)
+                heapq.heapify(controller.queue)
+                controller.condition.notify_all()
+                raise
+
+            # Start the request.
+            heapq.heappop(controller.queue)
+            controller.in_flight += 1
+            controller.served_rounds[priority] = request_round
+            if max_requests_per_second: controller.next_start = time.monotonic() + 1 / max_requests_per_second
+
+            # Forget callers with no request left ahead of the served round.
+            for key in [key for key, next_round in controller.caller_rounds.items() if key[0] == priority and next_round <= request_round]:
+                del controller.caller_rounds[key]
+
+            # Let the next request in the queue check whether it may start too.
+            controller.condition.notify_all()
+
+    def _release(self, plc_ip: str) -> None:
+        """
+        #### Description:
+        Mark a request as finished.
+        """
+        controller = self._get_controller(plc_ip)
+        with controller.condition:
+            controller.in_flight -= 1
+            controller.condition.notify_all()
@@ -0,0 +1,146 @@
+import os
+import pathlib
+import sqlite3
+from datetime import datetime, timezone
+
+class TagIndex:
+
+    def __init__(self, file_path: str, read_only: bool = False):
+        """
+        #### Description:
+        Open (or create) a persistent tag name search index, stored as a sqlite database.
+
+        #### Args:
+            file_path (str): Path to the index file.
+            read_only (bool): If True, open an existing index for searching only. Raises FileNotFoundError if there is none.
+        """
+        self.file_path = file_path
+
+        # A read-only index must exist, rather than being silently created empty.
+        if read_only and not os.path.isfile(file_path): raise FileNotFoundError(f"tag index at '{file_path}' does not exist.")
+
+        try:
+            if read_only:
+                self._connection = sqlite3.connect(pathlib.Path(file_path).absolute().as_uri() + "?mode=ro", uri=True)
+            else:
+                self._connection = sqlite3.connect(file_path)
+                self._connection.executescript("""
+                    CREATE TABLE IF NOT EXISTS tags (
+                        ip_address TEXT NOT NULL,
+                        tag_name TEXT NOT NULL,
+                        tag_name_lower TEXT NOT NULL,
+                        data_type TEXT NOT NULL,
+                        indexed_utc TEXT NOT NULL,
+                        PRIMARY KEY (ip_address, tag_name)
+                    );
+                    CREATE INDEX IF NOT EXISTS tags_by_name ON tags (tag_name_lower);
+                    CREATE INDEX IF NOT EXISTS tags_by_data_type ON tags (data_type);
+                """)
+        except Exception as e:
+            raise Exception(f"error opening tag index at '{file_path}': {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """
+        #### Description:
+        Close the index.
+        """
+        self._connection.close()
+
+    def add_tags(self, tag_info: dict) -> int:
+        """
+        #### Description:
+        Add browse results to the index. The previous entries of every PLC present in the browse results
+        are replaced, so tags deleted from a PLC drop out of the index.
+
+        #### Args:
+            tag_info (dict): Dictionary of tags, as returned by InterfaceRsLinx._get_all_available_tags.
+
+        #### Returns:
+            int: Number of tags indexed.
+        """
+        indexed_utc = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        rows = [(info["ip_address"], tag_name, tag_name.lower(), str(info["data_type"]), indexed_utc) for tag_name, info in tag_info.items()]
+        plc_ips = {row[0] for row in rows}
+        try:
+            with self._connection:
+                self._connection.executemany("DELETE FROM tags WHERE ip_address = ?", [(plc_ip,) for plc_ip in plc_ips])
+                self._connection.executemany("INSERT INTO tags VALUES (?, ?, ?, ?, ?)", rows)
+            return len(rows)
+        except Exception as e:
+            raise Exception(f"error adding tags to index at '{self.file_path}': {e}")
+
+    def remove_plc(self, plc_ip: str) -> None:
+        """
+        #### Description:
+        Remove every tag of a PLC from the index.
+
+        #### Args:
+            plc_ip (str): IP address of the PLC.
+        """
+        with self._connection:
+            self._connection.execute("DELETE FROM tags WHERE ip_address = ?", (plc_ip,))
+
+    def search(self, pattern: str = None, prefix: str = None, data_type: str = None, plc_ip: str = None, limit: int = None) -> list[dict]:
+        """
+        #### Description:
+        Search the index. Tag name matching is case-insensitive, as tag names are in the PLC.
+        Criteria given together must all match.
+
+        #### Args:
+            pattern (str): Optional glob pattern the whole tag name must match (e.g. "*Motor*.FaultCode").
+                           Use "*text*" for a substring search.
+            prefix (str): Optional prefix the tag name must start with (e.g. "Line1_").
+            data_type (str): Optional data type the tag must have (e.g. "DINT").
+            plc_ip (str): Optional IP address of the PLC the tag must belong to.
+            limit (int): Optional maximum number of matches returned.
+
+        #### Returns:
+            list: Matches, each a dictionary of ip_address, tag_name and data_type, sorted by ip address and tag name.
+        """
+
+        # Build the query from the criteria given.
+        conditions = []
+        parameters = []
+        if pattern is not None:
+            conditions.append("tag_name_lower GLOB ?")
+            parameters.append(pattern.lower())
+        if prefix is not None:
+
+            # A range on the indexed column, rather than LIKE, so the lookup uses the index.
+            conditions.append("tag_name_lower >= ? AND tag_name_lower < ?")
+            parameters += [prefix.lower(), prefix.lower() + '\U0010ffff']
+        if data_type is not None:
+            conditions.append("data_type = ?")
+            parameters.append(data_type.upper())
+        if plc_ip is not None:
+            conditions.append("ip_address = ?")
+            parameters.append(plc_ip)
+        query = "SELECT ip_address, tag_name, data_type FROM tags"
+        if conditions: query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY ip_address, tag_name_lower"
+        if limit is not None:
+            query += " LIMIT ?"
+            parameters.append(limit)
+
+        try:
+            rows = self._connection.execute(query, parameters).fetchall()
+            return [{"ip_address": row[0], "tag_name": row[1], "data_type": row[2]} for row in rows]
+        except Exception as e:
+            raise Exception(f"error searching tag index at '{self.file_path}': {e}")
+
+    def controllers(self) -> dict:
+        """
+        #### Description:
+        List the PLCs in the index.
+
+        #### Returns:
+            dict: Dictionary with ip addresses as keys, and the tag count and time indexed as values.
+        """
+        rows = self._connection.execute("SELECT ip_address, COUNT(*), MAX(indexed_utc) FROM tags GROUP BY ip_address").fetchall()
+        return {row[0]: {"tags": row[1], "indexed_utc": row[2]} for row in rows}
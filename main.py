@@ -1,10 +1,13 @@
 from cga_lib.interface_rslinx import InterfaceRsLinx
 from cga_lib.data_processors import DataProcessors
+from cga_lib.harvest_journal import HarvestJournal
 import pyperclip
 import write_tags_to_plc
 from wf_console import Console
 from wf_console.constants import Constants as color
 from tkinter import Tk, filedialog
+import os
+import tempfile
 
 def status_callback(message: str):
     """
@@ -47,10 +50,18 @@ def get_all_plc_tags():
     
     # If the user did not type "back"...
     if plc_ip.lower() != "back":
-        Console.fancy_print(f"press 'ctrl+c' to cancel operation.")
-        Console.fancy_print(f"getting all tags from plc at ip '{plc_ip}'...")
         try:
-            data = InterfaceRsLinx.get_all_available_tags(plc_ip, callback=status_callback)
+
+            # If an earlier harvest of this plc was interrupted, ask before resuming it.
+            checkpoint_path = os.path.join(tempfile.gettempdir(), f"cga_lib_harvest_{plc_ip}.jsonl")
+            run_id, read_data, failed = HarvestJournal.load(checkpoint_path, plc_ip)
+            if run_id is not None:
+                selection = Console.fancy_input(f"<INPUT_PROMPT>an interrupted harvest with {len(read_data) + len(failed)} tags already tried was found. resume it? (y/n): </INPUT_PROMPT>")
+                if selection.lower() not in ['y', 'yes']: HarvestJournal.clear(checkpoint_path, plc_ip)
+
+            Console.fancy_print(f"press 'ctrl+c' to cancel operation.")
+            Console.fancy_print(f"getting all tags from plc at ip '{plc_ip}'...")
+            data = InterfaceRsLinx.get_all_available_tags(plc_ip, callback=status_callback, checkpoint_path=checkpoint_path)
             data_str = DataProcessors.tag_dict_to_tab_delimited_string(data)
             pyperclip.copy(data_str)
             Console.clear()
@@ -83,7 +94,7 @@ def get_all_plc_tags():
         except KeyboardInterrupt:
             Console.clear()
             Console.fancy_print(f"\n<MENU_TITLE>---get all plc tags---</MENU_TITLE>")
-            Console.fancy_print(f"\n<WARNING>operation cancelled by user.</WARNING>")
+            Console.fancy_print(f"\n<WARNING>operation cancelled by user. progress was saved, rerun with the same ip to resume.</WARNING>")
             Console.press_enter_pause()
         except Exception as e:
             Console.clear()
@@ -145,6 +156,38 @@ def set_plc_time():
         # Pause before returning to menu.
         Console.press_enter_pause()
 
+def discover_plcs():
+    """
+    #### Description:
+    Discovers the PLCs on a subnet (or by broadcast) and copies their identity records to the clipboard.
+    """
+    
+    # Clear the console and print the header.
+    Console.clear(); Console.fancy_print(f"\n<MENU_TITLE>---discover plcs---</MENU_TITLE>")
+    
+    # Prompt the user for the subnet.
+    subnet = Console.fancy_input("<INPUT_PROMPT>\nenter subnet in cidr notation (e.g. 192.168.1.0/24), press enter to broadcast, or type 'back': </INPUT_PROMPT>")
+    
+    # If the user did not type "back"...
+    if subnet.lower() != "back":
+
+        # Execute the discovery operation.
+        Console.fancy_print(f"press 'ctrl+c' to cancel operation.")
+        Console.fancy_print(f"discovering plcs...")
+        try:
+            devices = InterfaceRsLinx.discover_devices(subnet if subnet else None, callback=status_callback)
+            for device in devices:
+                Console.fancy_print(f"<GOOD>{device['ip_address']}\t{device['product_name']}\tserial {device['serial_number']}\trev {device['revision']}</GOOD>")
+            pyperclip.copy(DataProcessors.device_list_to_tab_delimited_string(devices))
+            Console.fancy_print(f"\n<GOOD>done. {len(devices)} plc(s) found and copied to clipboard.</GOOD>")
+        except KeyboardInterrupt:
+            Console.fancy_print(f"\n<WARNING>operation cancelled by user.</WARNING>")
+        except Exception as e:
+            Console.fancy_print(f"<BAD>{e}</BAD>")
+
+        # Pause before returning to menu.
+        Console.press_enter_pause()
+
 if __name__ == "__main__":
 
     # Override colors used in the Console class.
@@ -165,7 +208,8 @@ if __name__ == "__main__":
         option_3 = "write tags to plc - <WARNING>refactoring</WARNING>"
         option_4 = "get plc time - <GOOD>COMPLETE: documented, unit tested, reviewed frontend & backend methods</GOOD>"
         option_5 = "set plc time to computer time - <GOOD>COMPLETE: documented, unit tested, reviewed frontend & backend methods</GOOD>"
-        menu_options = [option_1, option_2, option_3, option_4, option_5, "exit"]
+        option_6 = "discover plcs on subnet"
+        menu_options = [option_1, option_2, option_3, option_4, option_5, option_6, "exit"]
 
         # Print the menu and get user selection.
         int_selection, string_selection = Console.integer_only_menu_with_validation(title="CG Automation Library - RsLinx Interface", item_list=menu_options)
@@ -176,4 +220,5 @@ if __name__ == "__main__":
         if string_selection == option_3: write_tags_to_plc.routine()
         if string_selection == option_4: get_plc_time()
         if string_selection == option_5: set_plc_time()
+        if string_selection == option_6: discover_plcs()
         if string_selection == "exit": break
\ No newline at end of file
@@ -11,6 +11,11 @@ setup(
         "ping3==5.1.5",
         "pylogix==1.1.4",
     ],
+    entry_points={
+        "console_scripts": [
+            "cga-lib=cga_lib.cli:main",
+        ],
+    },
     classifiers=[
         "Programming Language :: Python :: 3"
     ],
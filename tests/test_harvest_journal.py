@@ -0,0 +1,56 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from cga_lib.harvest_journal import HarvestJournal
+
+
+def _write_entry(file_path, plc_ip, run_id, age_seconds, values, failed=()):
+    """
+    #### Description:
+    Append a journal entry checkpointed the given number of seconds ago.
+    """
+    timestamp_utc = (datetime.now(timezone.utc) - timedelta(seconds=age_seconds)).isoformat()
+    with open(file_path, 'a', encoding='utf-8') as journal_file:
+        journal_file.write(json.dumps({"ip_address": plc_ip, "run_id": run_id, "timestamp_utc": timestamp_utc,
+                                       "values": values, "failed": list(failed)}) + '\n')
+
+
+def test_load_resumes_latest_run(tmp_path):
+    file_path = str(tmp_path / "journal.jsonl")
+    HarvestJournal.append(file_path, "plc", "old", {"A": 1})
+    HarvestJournal.append(file_path, "plc", "new", {"B": 2}, ["C"])
+    HarvestJournal.append(file_path, "other", "other", {"D": 3})
+    assert HarvestJournal.load(file_path, "plc") == ("new", {"B": 2}, {"C"})
+
+
+def test_load_measures_age_from_last_checkpoint(tmp_path):
+    file_path = str(tmp_path / "journal.jsonl")
+
+    # A run started two hours ago, still checkpointing a minute ago, is resumed.
+    _write_entry(file_path, "plc", "run", 7200, {"A": 1})
+    _write_entry(file_path, "plc", "run", 60, {"B": 2})
+    assert HarvestJournal.load(file_path, "plc", max_age_seconds=3600) == ("run", {"A": 1, "B": 2}, set())
+
+    # A run last checkpointed two hours ago is not.
+    _write_entry(file_path, "other", "run", 7200, {"A": 1})
+    assert HarvestJournal.load(file_path, "other", max_age_seconds=3600) == (None, {}, set())
+
+
+def test_load_skips_torn_line(tmp_path):
+    file_path = str(tmp_path / "journal.jsonl")
+    HarvestJournal.append(file_path, "plc", "run", {"A": 1})
+    with open(file_path, 'a', encoding='utf-8') as journal_file:
+        journal_file.write('{"ip_address": "plc", "run_')
+    HarvestJournal.append(file_path, "plc", "run", {"B": 2})
+    assert HarvestJournal.load(file_path, "plc") == ("run", {"A": 1, "B": 2}, set())
+
+
+def test_clear_keeps_other_plcs(tmp_path):
+    file_path = tmp_path / "journal.jsonl"
+    HarvestJournal.append(str(file_path), "plc", "run", {"A": 1})
+    HarvestJournal.append(str(file_path), "other", "run", {"B": 2})
+    HarvestJournal.clear(str(file_path), "plc")
+    assert HarvestJournal.load(str(file_path), "plc") == (None, {}, set())
+    assert HarvestJournal.load(str(file_path), "other") == ("run", {"B": 2}, set())
+    HarvestJournal.clear(str(file_path), "other")
+    assert not file_path.exists()
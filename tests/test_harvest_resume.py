@@ -0,0 +1,80 @@
+import pytest
+
+pytest.importorskip("pylogix")
+pytest.importorskip("ping3")
+
+from cga_lib import interface_rslinx
+from cga_lib.harvest_journal import HarvestJournal
+from cga_lib.interface_rslinx import InterfaceRsLinx
+
+TAGS = [f"Tag{index:03d}" for index in range(300)]
+
+
+class _Response:
+
+    def __init__(self, tag_name, value, status):
+        self.TagName = tag_name
+        self.Value = value
+        self.Status = status
+
+
+class _FakePLC:
+    """
+    #### Description:
+    Stand-in for a pylogix PLC holding DINT tags. "Bad" fails with a per-tag error, and the connection
+    drops mid-read on the read numbered glitch_on_read, as pylogix reports it: a status, then no more responses.
+    """
+    glitch_on_read = None
+    reads = []
+
+    def __init__(self):
+        self.IPAddress = ""
+        self.ConnectionSize = 508
+        self.CIPTypes = {0xc4: (4, "DINT", "<i")}
+        self.UDTByName = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def Read(self, requests):
+        tag_names = [request[0] if isinstance(request, tuple) else request for request in requests]
+        _FakePLC.reads.append(tag_names)
+        if len(_FakePLC.reads) == _FakePLC.glitch_on_read:
+            return [_Response(tag, int(tag[3:]), "Success") for tag in tag_names[:5]] + [_Response(tag_names[5], None, "Connection lost")]
+        return [_Response(tag, None, "Path segment error") if tag == "Bad" else _Response(tag, int(tag[3:]), "Success") for tag in tag_names]
+
+
+@pytest.fixture
+def fake_plc(monkeypatch):
+    tag_info = {tag: {"ip_address": "plc", "data_type": "DINT", "value": None} for tag in TAGS + ["Bad"]}
+    monkeypatch.setattr(InterfaceRsLinx, "_get_all_available_tags", staticmethod(lambda plc_ip, callback=None: {tag: dict(info) for tag, info in tag_info.items()}))
+    monkeypatch.setattr(interface_rslinx, "PLC", _FakePLC)
+    monkeypatch.setattr(_FakePLC, "reads", [])
+    return _FakePLC
+
+
+def test_glitch_mid_harvest_then_rerun_reads_only_the_rest(fake_plc, tmp_path):
+    checkpoint_path = str(tmp_path / "journal.jsonl")
+
+    # The connection drops on the second batch. Nothing of that batch is journaled, nor reported as failed.
+    fake_plc.glitch_on_read = 2
+    with pytest.raises(ConnectionError):
+        InterfaceRsLinx.get_all_available_tags("plc", checkpoint_path=checkpoint_path, packets_per_checkpoint=1)
+    first_batch = fake_plc.reads[0]
+    run_id, values, failed = HarvestJournal.load(checkpoint_path, "plc")
+    assert run_id is not None
+    assert set(values) | failed == set(first_batch)
+    assert failed <= {"Bad"}
+
+    # The rerun reads only the tags the first batch did not, and finishes with every value.
+    fake_plc.glitch_on_read = None
+    fake_plc.reads = []
+    data = InterfaceRsLinx.get_all_available_tags("plc", checkpoint_path=checkpoint_path, packets_per_checkpoint=1)
+    reread = [tag for batch in fake_plc.reads for tag in batch]
+    assert sorted(reread + first_batch) == sorted(TAGS + ["Bad"])
+    assert all(data[tag]["value"] == int(tag[3:]) for tag in TAGS)
+    assert data["Bad"]["value"] is None
+    assert not (tmp_path / "journal.jsonl").exists()
@@ -0,0 +1,155 @@
+import threading
+import time
+
+import pytest
+
+from cga_lib.request_scheduler import RequestScheduler, RequestPriority
+
+
+def _hold_slot(scheduler, plc_ip):
+    """
+    #### Description:
+    Occupy the only slot of a PLC from another thread, so requests queue up behind it.
+
+    #### Returns:
+        tuple: Event releasing the slot, and the thread holding it.
+    """
+    release = threading.Event()
+    started = threading.Event()
+
+    def hold():
+        with scheduler.request(plc_ip, RequestPriority.BULK, caller="holder"):
+            started.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold)
+    thread.start()
+    started.wait()
+    return release, thread
+
+
+def _queue_requests(scheduler, plc_ip, requests, order):
+    """
+    #### Description:
+    Start one thread per (caller, priority, count), each making its requests in turn, and wait until all are queued.
+
+    #### Returns:
+        list: The threads.
+    """
+    threads = []
+    for caller, priority, count in requests:
+        def run(caller=caller, priority=priority, count=count):
+            for _ in range(count):
+                with scheduler.request(plc_ip, priority, caller=caller):
+                    order.append(caller)
+        threads.append(threading.Thread(target=run))
+    for thread in threads:
+        thread.start()
+
+    # Wait until every thread has its first request queued.
+    controller = scheduler._get_controller(plc_ip)
+    deadline = time.monotonic() + 5
+    while len(controller.queue) < len(requests) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return threads
+
+
+def test_priority_order():
+    scheduler = RequestScheduler()
+    order = []
+    release, holder = _hold_slot(scheduler, "plc")
+    threads = _queue_requests(scheduler, "plc", [("bulk", RequestPriority.BULK, 1),
+                                                 ("poll", RequestPriority.POLL, 1),
+                                                 ("write", RequestPriority.WRITE, 1)], order)
+    release.set()
+    for thread in threads + [holder]:
+        thread.join(5)
+    assert order == ["write", "poll", "bulk"]
+
+
+def test_round_robin_within_priority():
+    scheduler = RequestScheduler()
+    order = []
+    release, holder = _hold_slot(scheduler, "plc")
+    threads = _queue_requests(scheduler, "plc", [("a", RequestPriority.BULK, 3),
+                                                 ("b", RequestPriority.BULK, 3)], order)
+    release.set()
+    for thread in threads + [holder]:
+        thread.join(5)
+    assert order == ["a", "b", "a", "b", "a", "b"]
+
+
+def test_rate_limit():
+    scheduler = RequestScheduler(max_requests_per_second=20)
+    start = time.monotonic()
+    for _ in range(6):
+        with scheduler.request("plc"):
+            pass
+    assert time.monotonic() - start >= 5 / 20
+
+
+def test_rate_limit_is_per_plc():
+    scheduler = RequestScheduler()
+    scheduler.configure("slow", max_requests_per_second=1)
+    start = time.monotonic()
+    for _ in range(5):
+        with scheduler.request("fast"):
+            pass
+    with scheduler.request("slow"):
+        pass
+    assert time.monotonic() - start < 0.5
+
+
+def test_in_flight_limit():
+    scheduler = RequestScheduler(max_in_flight=2)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def run():
+        with scheduler.request("plc"):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+
+    threads = [threading.Thread(target=run) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert in_flight[1] == 2
+
+
+def test_configure_rejects_invalid_limits():
+    scheduler = RequestScheduler()
+    with pytest.raises(ValueError):
+        scheduler.configure("plc", max_in_flight=0)
+    with pytest.raises(ValueError):
+        scheduler.configure("plc", max_requests_per_second=0)
+
+
+def test_interrupted_wait_withdraws_request():
+    scheduler = RequestScheduler(max_requests_per_second=2)
+    with scheduler.request("plc", caller="a"):
+        pass
+
+    # Interrupt the next request while it waits out the rate limit, as ctrl+c would.
+    controller = scheduler._get_controller("plc")
+    def interrupted_wait(timeout=None):
+        raise KeyboardInterrupt
+    controller.condition.wait = interrupted_wait
+    with pytest.raises(KeyboardInterrupt):
+        with scheduler.request("plc", caller="a"):
+            pass
+    del controller.condition.wait
+    assert controller.queue == []
+
+    # The same caller is served again once the rate limit allows.
+    done = threading.Event()
+    def run():
+        with scheduler.request("plc", caller="a"):
+            done.set()
+    threading.Thread(target=run, daemon=True).start()
+    assert done.wait(5)
@@ -5,20 +5,6 @@ from wf_console import Console
 from wf_console.constants import Constants as color
 
 
-supported_data_types = [
-                        "BOOL",
-                        "SINT",
-                        "INT",
-                        "DINT",
-                        "LINT",
-                        "USINT",
-                        "UINT",
-                        "UDINT",
-                        "REAL",
-                        "LREAL",
-                        "STRING"
-]
-
 def write_tag_result(message: str, good: bool = True):
     """
     #### Description:
@@ -32,42 +18,6 @@ def write_tag_result(message: str, good: bool = True):
     else:
         Console.fancy_print(f"<BAD>{message}</BAD>")
 
-def _validate_and_format_tag_write_data(content: str) -> dict:
-
-    try:
-        tag_dict = {}
-        lines = content.strip().split('\n')
-        for line in lines:
-            line = line.strip('\r')
-            parts = line.split('\t')
-            
-            # Split the line into tag_address, value, and data_type.
-            tag_address = parts[0]
-            value = parts[1]
-            data_type = parts[2].upper()
-
-            # Check that the data type for the current tag is supported.
-            if data_type not in supported_data_types: 
-                Console.fancy_print(f"<BAD>unsupported data type '{data_type}' for tag '{tag_address}'</BAD>\n")
-                pass
-            else:
-                # Convert the value to the appropriate type based on data_type.
-                if data_type == "BOOL":
-                    tag_dict[tag_address] = True if value.lower() in ['1', 'true', 'yes'] else False
-                elif data_type in ["SINT", "INT", "DINT", "LINT"]:
-                    tag_dict[tag_address] = int(value)
-                elif data_type in ["USINT", "UINT", "UDINT"]:
-                    tag_dict[tag_address] = int(value)
-                elif data_type in ["REAL", "LREAL"]:
-                    tag_dict[tag_address] = float(value)
-                elif data_type == "STRING":
-                    tag_dict[tag_address] = str(value)
-
-        return tag_dict
-    except Exception as e:
-        raise Exception(f"error converting string to tag dictionary: {e}")
-
-
 def _correct_column_count(clipboard_data: str, column_count: int) -> bool:
     lines = clipboard_data.strip().split('\n')
     for line in lines:
@@ -115,7 +65,14 @@ def routine():
             return
         
         else:
-            converted_data = _validate_and_format_tag_write_data(clipboard_data)
+
+            # Convert the data, rejecting the whole selection if any row does not parse.
+            try:
+                converted_data = DataProcessors.tab_delimited_string_to_tag_dict(clipboard_data)
+            except Exception as e:
+                Console.fancy_print(f"\n<BAD>{e}</BAD>")
+                Console.press_enter_pause()
+                return
             
             # Prompt the user for the PLC IP address.
             plc_ip = Console.fancy_input("<INPUT_PROMPT>\nenter plc ip address or type 'back': </INPUT_PROMPT>")